@@ -1,12 +1,16 @@
-from database import db_context
+import msgspec
+from database import db_context, session_scope
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session, selectinload
 from models import OriginalText, Translation
 from schemas import (
     TextOutSchema,
     TranslationInSchema,
     TranslationOutSchema,
     TranslationRequestSchema,
+    construct_from_orm,
 )
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 
 def create_text(text) -> TextOutSchema:
@@ -27,12 +31,16 @@ def create_text(text) -> TextOutSchema:
     db_text = OriginalText(text=text, status="pending")
     with db_context() as db:
         db.add(db_text)
+        # Built before commit: the ID is known from the flush and the other
+        # fields were set here, so no refresh is needed afterwards.
+        text_out = TextOutSchema(
+            id=db_text.id, text=db_text.text, status=db_text.status
+        )
         db.commit()
-        db.refresh(db_text)
-    return TextOutSchema(**db_text.__dict__)
+    return text_out
 
 
-def get_text(text_id: int) -> Optional[OriginalText]:
+def get_text(text_id: int, db: Optional[Session] = None) -> Optional[OriginalText]:
     """
     Retrieves an original text record from the database by its ID.
 
@@ -41,28 +49,65 @@ def get_text(text_id: int) -> Optional[OriginalText]:
 
     Args:
         text_id (int): The unique identifier of the original text record.
+        db (Optional[Session]): An open session to run the query in. A new
+                                session is opened when omitted.
 
     Returns:
         Optional[OriginalText]: The original text record object if found,
                                 otherwise None.
     """
-    with db_context() as db:
+    with session_scope(db) as db:
         text = db.query(OriginalText).filter(OriginalText.id == text_id).first()
     if text:
         return text
 
 
-def update_text_status(text_id: int, new_status: str):
+def get_text_with_translations(
+    text_id: int, db: Optional[Session] = None
+) -> Optional[OriginalText]:
+    """
+    Retrieves an original text record together with all of its translations.
+
+    The `translations` relationship is eager-loaded with `selectinload`, so
+    the text and its translations are fetched in a single session and can be
+    read after the session has been closed.
+
+    Args:
+        text_id (int): The unique identifier of the original text record.
+        db (Optional[Session]): An open session to run the query in. A new
+                                session is opened when omitted.
+
+    Returns:
+        Optional[OriginalText]: The original text record object with its
+                                translations loaded if found, otherwise None.
+    """
+    with session_scope(db) as db:
+        text = (
+            db.query(OriginalText)
+            .options(selectinload(OriginalText.translations))
+            .filter(OriginalText.id == text_id)
+            .first()
+        )
+    if text:
+        return text
+
+
+def update_text_status(
+    text_id: int, new_status: str, db: Optional[Session] = None
+) -> Optional[TextOutSchema]:
     """
     Updates the status of an original text record in the database.
 
-    This function locates the original text record identified by `text_id`
-    and updates its status to the provided `new_status`. It then commits
-    the changes to the database.
+    This function updates the status of the original text record identified
+    by `text_id` to the provided `new_status` with a single
+    `UPDATE ... RETURNING` statement. It then commits the changes to the
+    database.
 
     Args:
         text_id (int): The unique identifier of the original text record.
         new_status (str): The new status to be set for the text record.
+        db (Optional[Session]): An open session to run the update in. A new
+                                session is opened when omitted.
 
     Returns:
         Optional[TextOutSchema]:
@@ -70,13 +115,17 @@ def update_text_status(text_id: int, new_status: str):
             - None if the text record with the provided ID is not found.
     """
 
-    with db_context() as db:
-        db_text = db.query(OriginalText).filter(OriginalText.id == text_id).first()
-        if db_text:
-            db_text.status = new_status
-            db.commit()
-        else:
-            return None
+    stmt = (
+        update(OriginalText)
+        .where(OriginalText.id == text_id)
+        .values(status=new_status)
+        .returning(*OriginalText.__table__.columns)
+    )
+    with session_scope(db) as db:
+        row = db.execute(stmt).fetchone()
+        db.commit()
+    if row:
+        return TextOutSchema(**row._mapping)
 
 
 def create_translation(translation: TranslationInSchema) -> TranslationOutSchema:
@@ -96,15 +145,15 @@ def create_translation(translation: TranslationInSchema) -> TranslationOutSchema
                               translation record with details like ID, text ID,
                               language, status, and translated content (if available).
     """
-    db_translation = Translation(**translation.dict())
+    db_translation = Translation(**msgspec.structs.asdict(translation))
     with db_context() as db:
         db.add(db_translation)
         db.commit()
         db.refresh(db_translation)
-    return TranslationOutSchema(**db_translation.__dict__)
+    return construct_from_orm(TranslationOutSchema, db_translation)
 
 
-def get_translation(id: int) -> Optional[Translation]:
+def get_translation(id: int, db: Optional[Session] = None) -> Optional[Translation]:
     """
     Retrieves a translation record from the database by its ID.
 
@@ -113,23 +162,83 @@ def get_translation(id: int) -> Optional[Translation]:
 
     Args:
         id (int): The unique identifier of the translation record.
+        db (Optional[Session]): An open session to run the query in. A new
+                                session is opened when omitted.
 
     Returns:
         Optional[Translation]: The translation record object if found,
                                 otherwise None.
     """
-    with db_context() as db:
+    with session_scope(db) as db:
         translation = db.query(Translation).filter(Translation.id == id).first()
     if translation:
         return translation
 
 
-def get_translations_for_text(text_id: int) -> List[TranslationOutSchema]:
+def get_translation_language(
+    id: int, db: Optional[Session] = None
+) -> Optional[Tuple[str, int]]:
+    """
+    Retrieves only the target language and text ID of a translation record.
+
+    Unlike `get_translation`, this does not load the translated content, which
+    can be large.
+
+    Args:
+        id (int): The unique identifier of the translation record.
+        db (Optional[Session]): An open session to run the query in. A new
+                                session is opened when omitted.
+
+    Returns:
+        Optional[Tuple[str, int]]: A `(language, text_id)` pair if found,
+                                   otherwise None.
+    """
+    with session_scope(db) as db:
+        row = (
+            db.query(Translation.language, Translation.text_id)
+            .filter(Translation.id == id)
+            .first()
+        )
+    if row:
+        return row.language, row.text_id
+
+
+def get_translation_languages_for_text(
+    text_id: int, db: Optional[Session] = None
+) -> List[Tuple[int, str]]:
+    """
+    Retrieves the ID and target language of every translation record for a
+    specific original text, in a single query.
+
+    Args:
+        text_id (int): The unique identifier of the original text.
+        db (Optional[Session]): An open session to run the query in. A new
+                                session is opened when omitted.
+
+    Returns:
+        List[Tuple[int, str]]: An `(id, language)` pair for each translation
+                               associated with the original text identified
+                               by `text_id`.
+    """
+    with session_scope(db) as db:
+        rows = (
+            db.query(Translation.id, Translation.language)
+            .filter(Translation.text_id == text_id)
+            .all()
+        )
+    return [(row.id, row.language) for row in rows]
+
+
+def get_translations_for_text(
+    text_id: int, db: Optional[Session] = None
+) -> List[TranslationOutSchema]:
     """
     Retrieves all translation records associated with a specific original text.
 
     Args:
         text_id (int): The unique identifier of the original text.
+        db (Optional[Session]): An open session to run the query in. A new
+                                session is opened when omitted.
 
     Returns:
         List[TranslationOutSchema]: A list of schema objects representing
@@ -137,41 +246,49 @@ def get_translations_for_text(text_id: int) -> List[TranslationOutSchema]:
                                     original text identified by `text_id`.
     """
 
-    with db_context() as db:
+    with session_scope(db) as db:
         translations = (
             db.query(Translation).filter(Translation.text_id == text_id).all()
         )
 
-        translations = [TranslationOutSchema(**t.__dict__) for t in translations]
+        translations = [
+            construct_from_orm(TranslationOutSchema, t) for t in translations
+        ]
     return translations
 
 
 def update_translation_fields(
-    id: int, status: str, translated_content: str
-) -> TranslationOutSchema:
+    id: int, status: str, translated_content: str, db: Optional[Session] = None
+) -> Optional[TranslationOutSchema]:
     """
     Updates the status and translated content of a translation record.
 
+    The row is updated and read back with a single `UPDATE ... RETURNING`
+    statement, so no prior SELECT or refresh is needed.
+
     Args:
         id (int): The unique identifier of the translation record.
         status (str): The new status to be set for the translation.
         translated_content (str): The translated content for the record (optional).
+        db (Optional[Session]): An open session to run the update in. A new
+                                session is opened when omitted.
 
     Returns:
         Optional[TranslationOutSchema]:
             - A schema object representing the updated translation record if successful.
-
+            - None if the translation record with the provided ID is not found.
     """
-    with db_context() as db:
-        db_translation = db.query(Translation).filter(Translation.id == id).first()
-        if db_translation:
-            db_translation.status = status
-            db_translation.translated_content = translated_content
-            db.commit()
-            db.refresh(db_translation)
-            return TranslationOutSchema(**db_translation.__dict__)
-        else:
-            return None
+    stmt = (
+        update(Translation)
+        .where(Translation.id == id)
+        .values(status=status, translated_content=translated_content)
+        .returning(*Translation.__table__.columns)
+    )
+    with session_scope(db) as db:
+        row = db.execute(stmt).fetchone()
+        db.commit()
+    if row:
+        return TranslationOutSchema.construct(**row._mapping)
 
 
 def create_translation_task(
@@ -189,6 +306,10 @@ def create_translation_task(
        associated with the original text and the specific language, setting
        the initial status to "pending".
 
+    All records are written in a single session and committed once. The
+    translations are inserted with one Core-level executemany INSERT, so the
+    number of round-trips does not grow with the number of languages.
+
     The function finally returns a schema object representing the created
     original text record.
 
@@ -201,10 +322,22 @@ def create_translation_task(
         TextOutSchema: A schema object representing the created original text
                        record with details like ID, text content, and status.
     """
-    text = create_text(text=translation_request.text)
-    for language in translation_request.languages:
-        translation = TranslationInSchema(
-            text_id=text.id, language=language, status="pending"
+    db_text = OriginalText(text=translation_request.text, status="pending")
+    with db_context() as db:
+        db.add(db_text)
+        db.flush()
+        if translation_request.languages:
+            db.execute(
+                insert(Translation),
+                [
+                    {"text_id": db_text.id, "language": language, "status": "pending"}
+                    for language in translation_request.languages
+                ],
+            )
+        # Built before commit: the ID is known from the flush and the other
+        # fields were set here, so no refresh is needed afterwards.
+        text_out = TextOutSchema(
+            id=db_text.id, text=db_text.text, status=db_text.status
         )
-        create_translation(translation)
-    return text
+        db.commit()
+    return text_out
@@ -0,0 +1,193 @@
+from database import async_db_context
+from models import OriginalText, Translation
+from schemas import TextOutSchema, TranslationOutSchema, TranslationRequestSchema
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import selectinload
+from typing import Optional, List, Tuple
+
+
+async def get_text(text_id: int) -> Optional[OriginalText]:
+    """
+    Retrieves an original text record from the database by its ID.
+
+    Args:
+        text_id (int): The unique identifier of the original text record.
+
+    Returns:
+        Optional[OriginalText]: The original text record object if found,
+                                otherwise None.
+    """
+    async with async_db_context() as db:
+        result = await db.execute(
+            select(OriginalText).where(OriginalText.id == text_id)
+        )
+        text = result.scalars().first()
+    if text:
+        return text
+
+
+async def get_text_with_translations(text_id: int) -> Optional[OriginalText]:
+    """
+    Retrieves an original text record together with all of its translations.
+
+    Lazy loading is not available on async sessions, so the `translations`
+    relationship is always eager-loaded with `selectinload`.
+
+    Args:
+        text_id (int): The unique identifier of the original text record.
+
+    Returns:
+        Optional[OriginalText]: The original text record object with its
+                                translations loaded if found, otherwise None.
+    """
+    async with async_db_context() as db:
+        result = await db.execute(
+            select(OriginalText)
+            .options(selectinload(OriginalText.translations))
+            .where(OriginalText.id == text_id)
+        )
+        text = result.scalars().first()
+    if text:
+        return text
+
+
+async def update_text_status(
+    text_id: int, new_status: str
+) -> Optional[TextOutSchema]:
+    """
+    Updates the status of an original text record with a single
+    `UPDATE ... RETURNING` statement.
+
+    Args:
+        text_id (int): The unique identifier of the original text record.
+        new_status (str): The new status to be set for the text record.
+
+    Returns:
+        Optional[TextOutSchema]:
+            - A schema object representing the updated text record if successful.
+            - None if the text record with the provided ID is not found.
+    """
+    stmt = (
+        update(OriginalText)
+        .where(OriginalText.id == text_id)
+        .values(status=new_status)
+        .returning(*OriginalText.__table__.columns)
+    )
+    async with async_db_context() as db:
+        result = await db.execute(stmt)
+        row = result.fetchone()
+        await db.commit()
+    if row:
+        return TextOutSchema(**row._mapping)
+
+
+async def get_translation_language(id: int) -> Optional[Tuple[str, int]]:
+    """
+    Retrieves only the target language and text ID of a translation record.
+
+    Args:
+        id (int): The unique identifier of the translation record.
+
+    Returns:
+        Optional[Tuple[str, int]]: A `(language, text_id)` pair if found,
+                                   otherwise None.
+    """
+    async with async_db_context() as db:
+        result = await db.execute(
+            select(Translation.language, Translation.text_id).where(
+                Translation.id == id
+            )
+        )
+        row = result.first()
+    if row:
+        return row.language, row.text_id
+
+
+async def get_translation_ids_for_text(text_id: int) -> List[int]:
+    """
+    Retrieves the IDs of all translation records for a specific original text.
+
+    Args:
+        text_id (int): The unique identifier of the original text.
+
+    Returns:
+        List[int]: The IDs of all translations associated with the original
+                   text identified by `text_id`.
+    """
+    async with async_db_context() as db:
+        result = await db.execute(
+            select(Translation.id).where(Translation.text_id == text_id)
+        )
+        translation_ids = result.scalars().all()
+    return translation_ids
+
+
+async def update_translation_fields(
+    id: int, status: str, translated_content: str
+) -> Optional[TranslationOutSchema]:
+    """
+    Updates the status and translated content of a translation record with a
+    single `UPDATE ... RETURNING` statement.
+
+    Args:
+        id (int): The unique identifier of the translation record.
+        status (str): The new status to be set for the translation.
+        translated_content (str): The translated content for the record.
+
+    Returns:
+        Optional[TranslationOutSchema]:
+            - A schema object representing the updated translation record if successful.
+            - None if the translation record with the provided ID is not found.
+    """
+    stmt = (
+        update(Translation)
+        .where(Translation.id == id)
+        .values(status=status, translated_content=translated_content)
+        .returning(*Translation.__table__.columns)
+    )
+    async with async_db_context() as db:
+        result = await db.execute(stmt)
+        row = result.fetchone()
+        await db.commit()
+    if row:
+        return TranslationOutSchema.construct(**row._mapping)
+
+
+async def create_translation_task(
+    translation_request: TranslationRequestSchema,
+) -> TextOutSchema:
+    """
+    Creates a new original text record and associated translation tasks.
+
+    The text and one "pending" translation per requested language are written
+    in a single session and committed once; the translations go through one
+    Core-level executemany INSERT.
+
+    Args:
+        translation_request (TranslationRequestSchema): A schema object containing
+                                                        the original text and
+                                                        target languages.
+
+    Returns:
+        TextOutSchema: A schema object representing the created original text
+                       record with details like ID, text content, and status.
+    """
+    db_text = OriginalText(text=translation_request.text, status="pending")
+    async with async_db_context() as db:
+        db.add(db_text)
+        await db.flush()
+        if translation_request.languages:
+            await db.execute(
+                insert(Translation),
+                [
+                    {"text_id": db_text.id, "language": language, "status": "pending"}
+                    for language in translation_request.languages
+                ],
+            )
+        # Built before commit: the ID is known from the flush and the other
+        # fields were set here, so no refresh is needed afterwards.
+        text_out = TextOutSchema(
+            id=db_text.id, text=db_text.text, status=db_text.status
+        )
+        await db.commit()
+    return text_out
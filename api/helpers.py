@@ -1,34 +1,85 @@
+import hashlib
 import spacy
+import threading
+from collections import OrderedDict
 
 
-nlp = spacy.load("en_core_web_sm")
+# Only sentence boundaries are needed, so the statistical components are
+# disabled and the rule-based sentencizer is used in place of the parser.
+nlp = spacy.load(
+    "en_core_web_sm",
+    disable=["tok2vec", "tagger", "parser", "ner", "lemmatizer", "attribute_ruler"],
+)
+nlp.add_pipe("sentencizer")
 
+# LRU cache of segmentation results, keyed on a BLAKE2b digest of the text so
+# the keys stay small however long the texts are. Results are stored as tuples
+# so callers cannot mutate the shared entries.
+SEGMENT_CACHE_SIZE = 256
+_SEGMENT_CACHE: "OrderedDict[bytes, tuple]" = OrderedDict()
+_SEGMENT_CACHE_LOCK = threading.Lock()
 
-def split_text_into_sentence_groups(text: str) -> list:
+
+def _group_sentences(doc) -> list:
     """
-    This function splits a given text string into groups of sentences,
-    ensuring each group contains a maximum of 20 sentences.
+    Groups the sentences of a processed spaCy document into strings of at
+    most 20 sentences each.
+
+    Each group is sliced straight out of the original text using the
+    sentences' character offsets, rather than re-joining the sentence
+    strings, so the original whitespace between sentences is kept.
 
     Args:
-        text (str): The text string to be split.
+        doc (Doc): The spaCy document to group.
 
     Returns:
-        list: A list containing the text split into groups of sentences,
-              where each group has no more than 20 sentences.
+        list: A list of sentence groups.
     """
-    doc = nlp(text)
+    text = doc.text
     sentence_groups = []
-    current_group = []
+    group_start = None
+    group_end = None
+    count = 0
 
     for sent in doc.sents:
-        current_group.append(sent.text)
-        if len(current_group) == 20:
-            current_group = " ".join(current_group)
-            sentence_groups.append(current_group)
-            current_group = []
+        if group_start is None:
+            group_start = sent.start_char
+        group_end = sent.end_char
+        count += 1
+        if count == 20:
+            sentence_groups.append(text[group_start:group_end])
+            group_start = None
+            count = 0
 
-    if current_group:
-        current_group = " ".join(current_group)
-        sentence_groups.append(current_group)
+    if group_start is not None:
+        sentence_groups.append(text[group_start:group_end])
 
     return sentence_groups
+
+
+def split_text_into_sentence_groups(text: str) -> list:
+    """
+    This function splits a given text string into groups of sentences,
+    ensuring each group contains a maximum of 20 sentences. Results for the
+    most recently seen texts are cached, so a resubmitted text is not run
+    through spaCy again.
+
+    Args:
+        text (str): The text string to be split.
+
+    Returns:
+        list: A list containing the text split into groups of sentences,
+              where each group has no more than 20 sentences.
+    """
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    with _SEGMENT_CACHE_LOCK:
+        sentence_groups = _SEGMENT_CACHE.get(key)
+        if sentence_groups is not None:
+            _SEGMENT_CACHE.move_to_end(key)
+    if sentence_groups is None:
+        sentence_groups = tuple(_group_sentences(nlp(text)))
+        with _SEGMENT_CACHE_LOCK:
+            _SEGMENT_CACHE[key] = sentence_groups
+            if len(_SEGMENT_CACHE) > SEGMENT_CACHE_SIZE:
+                _SEGMENT_CACHE.popitem(last=False)
+    return list(sentence_groups)
@@ -1,19 +1,39 @@
-from fastapi import FastAPI
+import os
+
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from database import engine
 from models import Base
-from schemas import TranslationRequestSchema, TextTranslationsSchema
-from crud import create_translation_task, get_text, get_translations_for_text
+from schemas import (
+    TranslationRequestSchema,
+    TextTranslationsSchema,
+    TranslationOutSchema,
+    construct_from_orm,
+)
+from crud_async import create_translation_task, get_text_with_translations
 
 from tasks import process_translation
+from tasks_async import close_client, process_translation as process_translation_async
 from typing import Union
 
+# Run translations with the asyncio pipeline on the app's own event loop
+# instead of handing them to the Celery worker.
+ASYNC_PIPELINE = os.environ.get("ASYNC_PIPELINE", "").lower() in ("1", "true", "yes")
+
 Base.metadata.create_all(bind=engine)
 app = FastAPI()
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    await close_client()
+
+
 @app.post("/translate")
-def translate(languages: list[str], text: str):
+async def translate(
+    languages: list[str], text: str, background_tasks: BackgroundTasks
+):
     """
     Initiates a translation task for the provided text in the specified languages.
 
@@ -27,21 +47,25 @@ def translate(languages: list[str], text: str):
         dict: A dictionary containing the key "task_id" with the ID of the
               created translation task.
     """
-    text = create_translation_task(
+    text = await create_translation_task(
         TranslationRequestSchema(text=text, languages=languages)
     )
-    process_translation.delay(text.id)
+    if ASYNC_PIPELINE:
+        background_tasks.add_task(process_translation_async, text.id)
+    else:
+        # Publishing to the broker is blocking Redis I/O, so keep it off the loop.
+        await run_in_threadpool(process_translation.delay, text.id)
 
     return {"task_id": text.id}
 
 
 @app.get("/translate/{task_id}", response_model=Union[TextTranslationsSchema, dict])
-def get_translate(task_id: str):
+async def get_translate(task_id: int):
     """
     Retrieves the status and results of a translation task identified by its ID.
 
     Args:
-        task_id (str): The unique identifier of the translation task.
+        task_id (int): The unique identifier of the translation task.
 
     Returns:
         Union[TextTranslationsSchema, dict]:
@@ -49,11 +73,21 @@ def get_translate(task_id: str):
               "in progress".
             - If the task is complete, a `TextTranslationsSchema` object
               containing the task ID, original text, and translated content.
+
+    Raises:
+        HTTPException: 404 if no translation task exists with the given ID.
     """
-    task = get_text(task_id)
+    task = await get_text_with_translations(task_id)
+
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
 
     if task.status == "pending":
         return {"status": "in progress"}
-    else:
-        translations = get_translations_for_text(task_id)
-    return TextTranslationsSchema(id=task.id, text=task.text, translations=translations)
+    return TextTranslationsSchema(
+        id=task.id,
+        text=task.text,
+        translations=[
+            construct_from_orm(TranslationOutSchema, t) for t in task.translations
+        ],
+    )
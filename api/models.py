@@ -16,7 +16,7 @@ class Translation(Base):
     __tablename__ = "translations"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    text_id = Column(Integer, ForeignKey("texts.id"), nullable=False)
+    text_id = Column(Integer, ForeignKey("texts.id"), nullable=False, index=True)
     status = Column(String, nullable=False)
     language = Column(String, nullable=False)
     translated_content = Column(Text)
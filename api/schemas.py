@@ -1,5 +1,6 @@
+import msgspec
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Optional, Type, TypeVar
 
 
 class TranslationRequestSchema(BaseModel):
@@ -7,21 +8,25 @@ class TranslationRequestSchema(BaseModel):
     languages: List[str]
 
 
-class TextInSchema(BaseModel):
+# Internal transfer objects between the CRUD layer and its callers. They are
+# never validated by FastAPI, so plain msgspec structs are used instead of
+# pydantic models to keep construction cheap.
+class TextInSchema(msgspec.Struct):
     text: str
     status: str
 
 
-class TextOutSchema(BaseModel):
+class TextOutSchema(msgspec.Struct):
     id: int
     text: str
     status: str
 
 
-class TranslationInSchema(BaseModel):
+class TranslationInSchema(msgspec.Struct):
     text_id: int
     language: str
     status: str
+    translated_content: Optional[str] = None
 
 
 class TranslationOutSchema(BaseModel):
@@ -36,3 +41,15 @@ class TextTranslationsSchema(BaseModel):
     id: int
     text: str
     translations: List[TranslationOutSchema]
+
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def construct_from_orm(schema: Type[Model], obj) -> Model:
+    """
+    Builds `schema` from the matching attributes of a trusted ORM object
+    without running pydantic validation. Only the declared fields are read,
+    so SQLAlchemy's instance state is never copied onto the model.
+    """
+    return schema.construct(**{f: getattr(obj, f) for f in schema.__fields__})
@@ -1,84 +1,189 @@
-from crud import (
+from crud_async import (
     get_text,
-    get_translation,
+    get_translation_language,
     update_translation_fields,
-    get_translations_for_text,
+    get_translation_ids_for_text,
     update_text_status,
 )
-from translation_gateway import translate
 from helpers import split_text_into_sentence_groups
 import asyncio
 import httpx
+import json
+import os
+import random
+import weakref
+from typing import List, Optional
 
+API_KEY = os.environ.get("API_KEY")
 
-async def process_individual_translation(translation_id: int):
-    translation = get_translation(translation_id)
-    text = get_text(translation.text_id)
-    chunks = split_text_into_sentence_groups(text.text)
+MAX_RETRIES = 6
+MAX_RETRY_DELAY = 60
+
+# Pooled clients, one per event loop, so connections to the API are kept alive
+# and reused instead of being opened for every chunk and retry.
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def process_individual_translation(
+    translation_id: int, chunks: Optional[List[str]] = None
+):
+    language, text_id = await get_translation_language(translation_id)
+    if chunks is None:
+        text = await get_text(text_id)
+        chunks = await asyncio.to_thread(split_text_into_sentence_groups, text.text)
 
     translated_sentences = []
 
     async def translate_chunk(chunk):
-        return await translate(chunk, translation.language)
+        return await query_gpt_async(chunk, language)
 
     tasks = [translate_chunk(chunk) for chunk in chunks]
     translated_sentences = await asyncio.gather(*tasks)
 
     translated_text = " ".join(translated_sentences)
 
-    update_translation_fields(
+    await update_translation_fields(
         translation_id, status="complete", translated_content=translated_text
     )
 
 
 async def process_translation(text_id: int):
-    translations = get_translations_for_text(text_id)
-    tasks = [process_individual_translation(t.id) for t in translations]
+    text = await get_text(text_id)
+    # spaCy is CPU-bound; keep it off the event loop, which may be the API's.
+    chunks = await asyncio.to_thread(split_text_into_sentence_groups, text.text)
+    translation_ids = await get_translation_ids_for_text(text_id)
+    tasks = [
+        process_individual_translation(translation_id, chunks)
+        for translation_id in translation_ids
+    ]
     await asyncio.gather(*tasks)
-    update_text_status(text_id, "completed")
+    await update_text_status(text_id, "completed")
+
+
+class StreamedCompletionError(Exception):
+    """Raised when a streamed completion fails after its response has begun."""
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Returns the pooled client of the running event loop, creating it on first
+    use. Pooled connections belong to the loop they were opened on, so a
+    client must never be shared between loops.
+    """
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=True,
+            timeout=48,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            headers={"Authorization": f"Bearer {API_KEY}"},
+        )
+        _CLIENTS[loop] = client
+    return client
 
 
-def process_text_background(text_id: int):
-    asyncio.run(process_translation(text_id))
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Returns how long to wait before the next request attempt.
+
+    The delay grows exponentially with the attempt number, capped at
+    MAX_RETRY_DELAY seconds, and is drawn uniformly from zero up to that
+    bound ("full jitter") so concurrently failing chunks do not retry in
+    lockstep. A numeric Retry-After header on a 429 response takes precedence.
+    """
+    if response is not None and response.status_code == 429:
+        retry_after = response.headers.get("Retry-After")
+        try:
+            return min(MAX_RETRY_DELAY, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+    return random.uniform(0, min(MAX_RETRY_DELAY, 2**attempt))
+
+
+async def _read_streamed_content(response: httpx.Response) -> str:
+    """
+    Accumulates the `delta.content` pieces of a streamed (server-sent events)
+    chat completion into the full message, as the lines arrive.
+
+    Raises:
+        StreamedCompletionError: If the stream carries an error event or an
+                                 event that is not valid JSON, stops at the
+                                 token limit, or ends before `[DONE]`.
+    """
+    pieces = []
+    done = False
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        payload = line[len("data:") :].strip()
+        if payload == "[DONE]":
+            done = True
+            break
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            raise StreamedCompletionError(f"Malformed stream event: {payload!r}")
+        if "error" in event:
+            raise StreamedCompletionError(event["error"].get("message", event))
+        choices = event.get("choices")
+        if choices:
+            if choices[0].get("finish_reason") == "length":
+                raise StreamedCompletionError("Completion truncated at max tokens")
+            pieces.append(choices[0].get("delta", {}).get("content") or "")
+    if not done:
+        # A clean EOF before [DONE] means the completion was cut short.
+        raise StreamedCompletionError("Stream ended before [DONE]")
+    return "".join(pieces)
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    """Rate limiting and server errors are transient; other 4xx are not."""
+    return status_code == 429 or status_code >= 500
 
 
 async def query_gpt_async(user_content: str, language: str) -> str:
     system_content = f"Translate into {language}"
 
-    retries = 42
-    wait_time = 21
-
-    while retries > 0:
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={"Authorization": "Bearer API_KEY"},
-                    json={
-                        "model": "gpt-3.5-turbo",
-                        "messages": [
-                            {"role": "system", "content": system_content},
-                            {"role": "user", "content": user_content},
-                        ],
-                        "temperature": 0.7,
-                    },
-                    timeout=48,
-                )
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            async with _get_client().stream(
+                "POST",
+                "https://api.openai.com/v1/chat/completions",
+                json={
+                    "model": "gpt-3.5-turbo",
+                    "messages": [
+                        {"role": "system", "content": system_content},
+                        {"role": "user", "content": user_content},
+                    ],
+                    "temperature": 0.7,
+                    "stream": True,
+                },
+            ) as response:
                 response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
-            except httpx.HTTPStatusError as e:
-                retries -= 1
-                if retries == 0:
-                    raise
-                else:
-                    print(f"Error: {e}, Retrying in {wait_time} seconds...")
-                    await asyncio.sleep(wait_time)
-            except httpx.ReadTimeout as e:
-                retries -= 1
-                if retries == 0:
-                    print(f"ReadTimeout error: {e}, Maximum retries reached.")
-                    break
-                else:
-                    print(f"ReadTimeout error: {e}, Retrying in {wait_time} seconds...")
-                    await asyncio.sleep(wait_time)
+                return await _read_streamed_content(response)
+        except httpx.HTTPStatusError as e:
+            if not _is_retryable_status(e.response.status_code):
+                raise
+            if attempt == MAX_RETRIES:
+                print(f"Error: {e}, Maximum retries reached.")
+                raise
+            wait_time = _retry_delay(attempt, e.response)
+            print(f"Error: {e}, Retrying in {wait_time:.1f} seconds...")
+        except (httpx.TransportError, StreamedCompletionError) as e:
+            # Timeouts, dropped connections or HTTP/2 streams, and error events
+            # sent mid-stream are all transient.
+            if attempt == MAX_RETRIES:
+                print(f"{type(e).__name__}: {e}, Maximum retries reached.")
+                raise
+            wait_time = _retry_delay(attempt)
+            print(f"{type(e).__name__}: {e}, Retrying in {wait_time:.1f} seconds...")
+        await asyncio.sleep(wait_time)
+
+
+async def close_client():
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
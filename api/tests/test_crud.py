@@ -5,9 +5,12 @@ from database import Base, db_context
 from api.crud import (
     create_text,
     get_text,
+    get_text_with_translations,
     update_text_status,
     create_translation,
     get_translation,
+    get_translation_language,
+    get_translation_languages_for_text,
     get_translations_for_text,
     update_translation_fields,
     create_translation_task,
@@ -137,6 +140,30 @@ def test_get_text(db_session: Session):
     assert result.status == original_text.status
 
 
+def test_get_text_with_translations(db_session: Session):
+    """
+    Tests the get_text_with_translations function.
+
+    Args:
+        db_session (Session): The SQLAlchemy session object for the test.
+    """
+    original_text = OriginalText(text="Sample text", status="completed")
+    db_session.add(original_text)
+    db_session.commit()
+    translation = Translation(
+        text_id=original_text.id,
+        language="es",
+        status="complete",
+        translated_content="Texto de muestra",
+    )
+    db_session.add(translation)
+    db_session.commit()
+    result = get_text_with_translations(original_text.id)
+    assert result.id == original_text.id
+    assert len(result.translations) == 1
+    assert result.translations[0].language == "es"
+
+
 def test_update_text_status(db_session: Session):
     """
     Tests the update_text_status function.
@@ -195,6 +222,44 @@ def test_get_translation(db_session: Session):
     assert result.translated_content == translation.translated_content
 
 
+def test_get_translation_language(db_session: Session):
+    """
+    Tests the get_translation_language function.
+
+    Args:
+        db_session (Session): The SQLAlchemy session object for the test.
+    """
+    translation = Translation(text_id=1, language="es", status="pending")
+    db_session.add(translation)
+    db_session.commit()
+    result = get_translation_language(translation.id)
+    assert result == ("es", 1)
+
+
+def test_get_translation_languages_for_text(db_session: Session):
+    """
+    Tests the get_translation_languages_for_text function.
+
+    Args:
+        db_session (Session): The SQLAlchemy session object for the test.
+    """
+    original_text = OriginalText(text="Sample text", status="pending")
+    db_session.add(original_text)
+    db_session.commit()
+    translation1 = Translation(
+        text_id=original_text.id, language="es", status="pending"
+    )
+    translation2 = Translation(
+        text_id=original_text.id, language="fr", status="pending"
+    )
+    db_session.add_all([translation1, translation2])
+    db_session.commit()
+    result = get_translation_languages_for_text(original_text.id)
+    assert sorted(result) == sorted(
+        [(translation1.id, "es"), (translation2.id, "fr")]
+    )
+
+
 def test_get_translations_for_text(db_session: Session):
     """
     Tests the get_translations_for_text function.
@@ -0,0 +1,198 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
+from database import Base
+import crud_async
+from crud_async import (
+    create_translation_task,
+    get_text,
+    get_text_with_translations,
+    get_translation_ids_for_text,
+    get_translation_language,
+    update_text_status,
+    update_translation_fields,
+)
+from schemas import TranslationRequestSchema
+from models import OriginalText, Translation
+from test_config import TEST_DATABASE_URL, TEST_ASYNC_DATABASE_URL
+
+engine = create_engine(TEST_DATABASE_URL)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Each test runs its coroutine under a fresh asyncio.run() loop, and asyncpg
+# connections cannot be shared between loops, so connections are not pooled.
+async_engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = sessionmaker(
+    bind=async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+
+@pytest.fixture(scope="module")
+def test_db():
+    """
+    Creates and drops the database schema for the tests.
+
+    Yields:
+        None
+    """
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session(test_db) -> Session:
+    """
+    Creates a new synchronous database session for seeding and checking rows.
+
+    Args:
+        test_db (None): Fixture for creating and dropping the test database schema.
+
+    Yields:
+        Session: A SQLAlchemy session object.
+    """
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def override_async_db_context(monkeypatch, test_db):
+    """
+    Points crud_async at the test database.
+
+    Args:
+        monkeypatch (MonkeyPatch): The pytest monkeypatch fixture.
+        test_db (None): Fixture for creating and dropping the test database schema.
+    """
+
+    @asynccontextmanager
+    async def _async_db_context():
+        session = TestingAsyncSessionLocal()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    monkeypatch.setattr(crud_async, "async_db_context", _async_db_context)
+
+
+def test_get_text(db_session: Session):
+    """
+    Tests the get_text function.
+
+    Args:
+        db_session (Session): The SQLAlchemy session object for the test.
+    """
+    original_text = OriginalText(text="Sample text", status="pending")
+    db_session.add(original_text)
+    db_session.commit()
+    result = asyncio.run(get_text(original_text.id))
+    assert result.id == original_text.id
+    assert result.text == original_text.text
+
+
+def test_get_text_with_translations(db_session: Session):
+    """
+    Tests the get_text_with_translations function.
+
+    Args:
+        db_session (Session): The SQLAlchemy session object for the test.
+    """
+    original_text = OriginalText(text="Sample text", status="completed")
+    db_session.add(original_text)
+    db_session.commit()
+    translation = Translation(
+        text_id=original_text.id,
+        language="es",
+        status="complete",
+        translated_content="Texto de muestra",
+    )
+    db_session.add(translation)
+    db_session.commit()
+    result = asyncio.run(get_text_with_translations(original_text.id))
+    assert result.id == original_text.id
+    assert len(result.translations) == 1
+    assert result.translations[0].translated_content == "Texto de muestra"
+
+
+def test_get_text_with_translations_not_found(db_session: Session):
+    """
+    Tests that get_text_with_translations returns None for an unknown ID.
+
+    Args:
+        db_session (Session): The SQLAlchemy session object for the test.
+    """
+    assert asyncio.run(get_text_with_translations(999999)) is None
+
+
+def test_update_text_status(db_session: Session):
+    """
+    Tests the update_text_status function.
+
+    Args:
+        db_session (Session): The SQLAlchemy session object for the test.
+    """
+    original_text = OriginalText(text="Sample text", status="pending")
+    db_session.add(original_text)
+    db_session.commit()
+    result = asyncio.run(update_text_status(original_text.id, "completed"))
+    assert result.status == "completed"
+    db_session.refresh(original_text)
+    assert original_text.status == "completed"
+
+
+def test_get_translation_language(db_session: Session):
+    """
+    Tests the get_translation_language function.
+
+    Args:
+        db_session (Session): The SQLAlchemy session object for the test.
+    """
+    translation = Translation(text_id=1, language="es", status="pending")
+    db_session.add(translation)
+    db_session.commit()
+    assert asyncio.run(get_translation_language(translation.id)) == ("es", 1)
+
+
+def test_update_translation_fields(db_session: Session):
+    """
+    Tests the update_translation_fields function.
+
+    Args:
+        db_session (Session): The SQLAlchemy session object for the test.
+    """
+    translation = Translation(text_id=1, language="es", status="pending")
+    db_session.add(translation)
+    db_session.commit()
+    result = asyncio.run(
+        update_translation_fields(translation.id, "complete", "Texto de muestra")
+    )
+    assert result.status == "complete"
+    assert result.translated_content == "Texto de muestra"
+
+
+def test_create_translation_task(db_session: Session):
+    """
+    Tests the create_translation_task function and get_translation_ids_for_text.
+
+    Args:
+        db_session (Session): The SQLAlchemy session object for the test.
+    """
+    request = TranslationRequestSchema(
+        text="This is a sample text.", languages=["es", "fr"]
+    )
+    result = asyncio.run(create_translation_task(request))
+    assert result.text == request.text
+    assert result.status == "pending"
+    translation_ids = asyncio.run(get_translation_ids_for_text(result.id))
+    assert len(translation_ids) == len(request.languages)
+    languages = [
+        asyncio.run(get_translation_language(translation_id))[0]
+        for translation_id in translation_ids
+    ]
+    assert sorted(languages) == sorted(request.languages)
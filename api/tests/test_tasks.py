@@ -0,0 +1,82 @@
+import threading
+import pytest
+from contextlib import contextmanager
+import tasks
+
+
+class FakeText:
+    text = "This is a sample text."
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    """
+    Replaces the database and translation API used by the Celery tasks with
+    in-memory fakes.
+
+    Args:
+        monkeypatch (MonkeyPatch): The pytest monkeypatch fixture.
+
+    Returns:
+        dict: The recorded translation updates and text statuses.
+    """
+    recorded = {"translations": {}, "statuses": []}
+
+    @contextmanager
+    def _db_context():
+        yield None
+
+    def _get_translation_language(translation_id, db=None):
+        raise AssertionError("languages must be fetched in one query")
+
+    monkeypatch.setattr(tasks, "db_context", _db_context)
+    monkeypatch.setattr(tasks, "get_text", lambda text_id, db=None: FakeText())
+    monkeypatch.setattr(
+        tasks,
+        "get_translation_languages_for_text",
+        lambda text_id, db=None: [(1, "es"), (2, "fr")],
+    )
+    monkeypatch.setattr(tasks, "get_translation_language", _get_translation_language)
+
+    def _update_translation_fields(id, status, translated_content, db=None):
+        recorded["translations"][id] = (status, translated_content)
+
+    def _update_text_status(text_id, new_status, db=None):
+        recorded["statuses"].append((text_id, new_status))
+
+    monkeypatch.setattr(tasks, "update_translation_fields", _update_translation_fields)
+    monkeypatch.setattr(tasks, "update_text_status", _update_text_status)
+    return recorded
+
+
+def test_process_translation_inline_skips_chord(monkeypatch, fake_backend):
+    """
+    Tests that a small batch is translated in-process, in parallel, without
+    dispatching a chord, and that the text ends up "completed".
+
+    Args:
+        monkeypatch (MonkeyPatch): The pytest monkeypatch fixture.
+        fake_backend (dict): The recorded database writes.
+    """
+
+    def _chord(*args, **kwargs):
+        raise AssertionError("chord must not be used for small batches")
+
+    # Both translations must be in flight at once for the barrier to release;
+    # processing them one after another would time out.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _query_gpt(chunk, language):
+        barrier.wait()
+        return f"[{language}] {chunk}"
+
+    monkeypatch.setattr(tasks, "chord", _chord)
+    monkeypatch.setattr(tasks, "query_gpt", _query_gpt)
+
+    tasks.process_translation.run(7)
+
+    assert fake_backend["translations"] == {
+        1: ("complete", "[es] This is a sample text."),
+        2: ("complete", "[fr] This is a sample text."),
+    }
+    assert fake_backend["statuses"] == [(7, "completed")]
@@ -0,0 +1,258 @@
+import asyncio
+import json
+import httpx
+import pytest
+import tasks_async
+from tasks_async import (
+    MAX_RETRIES,
+    MAX_RETRY_DELAY,
+    StreamedCompletionError,
+    _read_streamed_content,
+    _retry_delay,
+    query_gpt_async,
+)
+
+
+def sse_body(*contents: str) -> bytes:
+    """
+    Builds a streamed chat completion body carrying the given content pieces.
+
+    Args:
+        *contents (str): The `delta.content` pieces, in order.
+
+    Returns:
+        bytes: The server-sent events body, terminated by `[DONE]`.
+    """
+    events = [
+        "data: " + json.dumps({"choices": [{"delta": {"content": content}}]})
+        for content in contents
+    ]
+    events.append("data: [DONE]")
+    return ("\n\n".join(events) + "\n\n").encode()
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    """
+    Routes query_gpt_async through an httpx mock transport and removes the
+    backoff sleeps.
+
+    Args:
+        monkeypatch (MonkeyPatch): The pytest monkeypatch fixture.
+
+    Returns:
+        Callable: Installs a list of handlers, one per expected request, and
+                  returns the list of requests received.
+    """
+
+    def install(*handlers):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handlers[len(requests) - 1](request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(tasks_async, "_get_client", lambda: client)
+        monkeypatch.setattr(tasks_async, "_retry_delay", lambda *args: 0)
+        return requests
+
+    return install
+
+
+def test_retry_delay_is_jittered_and_capped():
+    """
+    Tests that _retry_delay stays within the exponential bound and the cap.
+    """
+    for attempt in range(1, 10):
+        for _ in range(50):
+            delay = _retry_delay(attempt)
+            assert 0 <= delay <= min(MAX_RETRY_DELAY, 2**attempt)
+
+
+def test_retry_delay_honours_retry_after():
+    """
+    Tests that a numeric Retry-After header on a 429 overrides the backoff.
+    """
+    response = httpx.Response(429, headers={"Retry-After": "7"})
+    assert _retry_delay(1, response) == 7
+
+
+def test_retry_delay_caps_retry_after():
+    """
+    Tests that a very large Retry-After is capped at MAX_RETRY_DELAY.
+    """
+    response = httpx.Response(429, headers={"Retry-After": "3600"})
+    assert _retry_delay(1, response) == MAX_RETRY_DELAY
+
+
+def test_retry_delay_ignores_invalid_retry_after():
+    """
+    Tests that a non-numeric Retry-After falls back to the jittered backoff.
+    """
+    response = httpx.Response(
+        429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+    assert 0 <= _retry_delay(1, response) <= 2
+
+
+def test_query_gpt_async_joins_streamed_content(mock_api):
+    """
+    Tests that the streamed delta pieces are joined into the full translation.
+
+    Args:
+        mock_api (Callable): Fixture installing the mocked API responses.
+    """
+    requests = mock_api(
+        lambda request: httpx.Response(200, content=sse_body("Ho", "la"))
+    )
+    assert asyncio.run(query_gpt_async("Hello", "Spanish")) == "Hola"
+    assert json.loads(requests[0].content)["stream"] is True
+
+
+def test_query_gpt_async_retries_server_errors(mock_api):
+    """
+    Tests that 429 and 5xx responses are retried.
+
+    Args:
+        mock_api (Callable): Fixture installing the mocked API responses.
+    """
+    requests = mock_api(
+        lambda request: httpx.Response(429),
+        lambda request: httpx.Response(503),
+        lambda request: httpx.Response(200, content=sse_body("Hola")),
+    )
+    assert asyncio.run(query_gpt_async("Hello", "Spanish")) == "Hola"
+    assert len(requests) == 3
+
+
+def test_query_gpt_async_does_not_retry_client_errors(mock_api):
+    """
+    Tests that non-retryable 4xx responses are raised immediately.
+
+    Args:
+        mock_api (Callable): Fixture installing the mocked API responses.
+    """
+    requests = mock_api(lambda request: httpx.Response(401))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(query_gpt_async("Hello", "Spanish"))
+    assert len(requests) == 1
+
+
+def test_query_gpt_async_raises_after_last_timeout(mock_api):
+    """
+    Tests that the timeout is raised once the retries are exhausted, rather
+    than returning None.
+
+    Args:
+        mock_api (Callable): Fixture installing the mocked API responses.
+    """
+
+    def timeout(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    requests = mock_api(*[timeout] * MAX_RETRIES)
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(query_gpt_async("Hello", "Spanish"))
+    assert len(requests) == MAX_RETRIES
+
+
+def test_read_streamed_content_skips_non_data_lines():
+    """
+    Tests that comments, blank lines and role-only deltas are ignored.
+    """
+    body = (
+        b": keep-alive\n\n"
+        b'data: {"choices": [{"delta": {"role": "assistant"}}]}\n\n'
+        b'data: {"choices": [{"delta": {"content": "Hola"}}]}\n\n'
+        b'data: {"choices": []}\n\n'
+        b"data: [DONE]\n\n"
+    )
+    response = httpx.Response(200, content=body)
+    assert asyncio.run(_read_streamed_content(response)) == "Hola"
+
+
+def test_read_streamed_content_raises_on_error_event():
+    """
+    Tests that an error event sent mid-stream raises StreamedCompletionError.
+    """
+    body = (
+        b'data: {"choices": [{"delta": {"content": "Ho"}}]}\n\n'
+        b'data: {"error": {"message": "The server had an error"}}\n\n'
+    )
+    response = httpx.Response(200, content=body)
+    with pytest.raises(StreamedCompletionError):
+        asyncio.run(_read_streamed_content(response))
+
+
+def test_query_gpt_async_retries_stream_errors(mock_api):
+    """
+    Tests that mid-stream error events and dropped streams are retried.
+
+    Args:
+        mock_api (Callable): Fixture installing the mocked API responses.
+    """
+
+    class DroppedStream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield b'data: {"choices": [{"delta": {"content": "Ho"}}]}\n\n'
+            raise httpx.RemoteProtocolError("stream reset")
+
+    def dropped(request):
+        return httpx.Response(200, stream=DroppedStream())
+
+    error_event = b'data: {"error": {"message": "The server had an error"}}\n\n'
+    requests = mock_api(
+        lambda request: httpx.Response(200, content=error_event),
+        dropped,
+        lambda request: httpx.Response(200, content=sse_body("Hola")),
+    )
+    assert asyncio.run(query_gpt_async("Hello", "Spanish")) == "Hola"
+    assert len(requests) == 3
+
+
+def test_query_gpt_async_retries_stream_without_done(mock_api):
+    """
+    Tests that a stream ending cleanly before `[DONE]` is retried rather than
+    returning the truncated content.
+
+    Args:
+        mock_api (Callable): Fixture installing the mocked API responses.
+    """
+    truncated = b'data: {"choices": [{"delta": {"content": "Ho"}}]}\n\n'
+    requests = mock_api(
+        lambda request: httpx.Response(200, content=truncated),
+        lambda request: httpx.Response(200, content=sse_body("Hola")),
+    )
+    assert asyncio.run(query_gpt_async("Hello", "Spanish")) == "Hola"
+    assert len(requests) == 2
+
+
+def test_read_streamed_content_raises_on_length_finish():
+    """
+    Tests that a completion stopped at the token limit is treated as an error.
+    """
+    body = (
+        b'data: {"choices": [{"delta": {"content": "Ho"}}]}\n\n'
+        b'data: {"choices": [{"delta": {}, "finish_reason": "length"}]}\n\n'
+        b"data: [DONE]\n\n"
+    )
+    response = httpx.Response(200, content=body)
+    with pytest.raises(StreamedCompletionError):
+        asyncio.run(_read_streamed_content(response))
+
+
+def test_query_gpt_async_raises_after_last_stream_error(mock_api):
+    """
+    Tests that a stream error is raised once the retries are exhausted.
+
+    Args:
+        mock_api (Callable): Fixture installing the mocked API responses.
+    """
+
+    def read_error(request):
+        raise httpx.ReadError("connection lost", request=request)
+
+    mock_api(*[read_error] * MAX_RETRIES)
+    with pytest.raises(httpx.ReadError):
+        asyncio.run(query_gpt_async("Hello", "Spanish"))
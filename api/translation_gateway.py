@@ -2,13 +2,25 @@ from openai import OpenAI
 import os
 
 API_KEY = os.environ.get("API_KEY")
-print(API_KEY)
+
+_OAI = None
+
+
+def _get_client() -> OpenAI:
+    """
+    Returns the shared OpenAI client, creating it on first use so that
+    importing this module does not require credentials. Reusing one client
+    keeps its HTTP connection pool warm across calls.
+    """
+    global _OAI
+    if _OAI is None:
+        _OAI = OpenAI(api_key=API_KEY)
+    return _OAI
 
 
 def query_gpt(user_content: str, language: str) -> str:
     system_content = f"Translate into {language}"
-    client = OpenAI(api_key=API_KEY)
-    completion = client.chat.completions.create(
+    completion = _get_client().chat.completions.create(
         model="gpt-3.5-turbo",
         messages=[
             {"role": "system", "content": system_content},
@@ -19,8 +31,3 @@ def query_gpt(user_content: str, language: str) -> str:
         ],
     )
     return completion.choices[0].message.content
-
-
-def translate(text: str, language: str) -> str:
-    """Translation wrapper."""
-    return query_gpt(text, language)